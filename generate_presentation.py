@@ -37,12 +37,123 @@ Using the CODE Macro:
 import os
 import sys
 import json
-import base64
 import re
 import shutil
+import functools
+import heapq
+import hashlib
+import mmap
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+
+# Notebooks at least this large (in bytes) are streamed cell by cell when ijson is available
+NOTEBOOK_STREAMING_THRESHOLD = 32 * 1024 * 1024
+
+# Embedded image MIME types extracted from code cell outputs, in order of
+# preference, and the file extension they are saved with
+IMAGE_MIME_TYPES = {
+    'image/png': 'png',
+    'image/jpeg': 'jpg',
+}
+
+# Windows compiles with Tectonic and gets Windows-specific install hints
+_IS_WINDOWS = sys.platform == 'win32'
+
+# Number of threads used to write extracted code files and images
+FILE_WRITE_WORKERS = 8
+
+# Base64 image data is decoded in chunks of this many characters (a multiple of 4)
+BASE64_CHUNK_SIZE = 64 * 1024
+_RE_WHITESPACE = re.compile(r'\s')
+
+# Resolved paths of external tools (tectonic, pdflatex, scoop) are cached in
+# the output directory under this name and reused for this many seconds
+TOOL_CACHE_FILE = '.toolcache.json'
+TOOL_CACHE_TTL = 24 * 60 * 60
+
+# Content hashes of the code files and images written on the last run are
+# kept in the output directory under this name, so unchanged files are not rewritten
+CELL_CACHE_FILE = '.cellcache.json'
+
+# Hash of the inputs of the last successful PDF build, kept in the output directory
+BUILD_HASH_FILE = '.texhash'
+
+# Special LaTeX characters escaped in markdown text
+_LATEX_ESCAPE = str.maketrans({
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+})
+
+# Markdown patterns used by markdown_to_latex: H4/H5 header lines and inline
+# formatting, matched together so the text is tokenized in a single pass.
+# ***x*** is matched before bold, and italic text may contain **bold** spans,
+# so nested emphasis is not cut short at the first inner '*'
+_RE_INLINE = re.compile(
+    r'^(?P<level>#{4,5})[ \t]+(?P<header>.*?)$'
+    r'|\*\*\*(?P<bolditalic>.*?)\*\*\*'
+    r'|\*\*(?P<bold>.*?)\*\*'
+    r'|\*(?!\s)(?P<italic>(?:\*\*.+?\*\*|[^*])*?)\*(?!\*[^*\s])'
+    r'|`(?P<code>.*?)`'
+    r'|\[(?P<link_text>.*?)\]\((?P<link_url>.*?)\)',
+    re.MULTILINE
+)
+
+# A run of consecutive "- " / "* " list item lines, and a whitespace-only line
+_RE_LIST_BLOCK = re.compile(r'(?:^[^\S\n]*[-*] [^\S\n]*\S.*(?:\n|$))+', re.MULTILINE)
+_RE_BLANK_LINES = re.compile(r'\n[^\S\n]*(?=\n|\Z)')
+
+# Author patterns used by extract_title_info, in order of preference
+# Pattern: "I, **Name**," or "by Name" or "Author: Name"
+_AUTHOR_PATTERNS = [re.compile(p) for p in (
+    r'I,?\s+\*\*([^*]+)\*\*,',  # Matches "I, **Name**,"
+    r'[Aa]uthor:?\s+([A-Z][a-zA-Z\s]+)',  # Matches "Author: Name"
+    r'[Bb]y:?\s+([A-Z][a-zA-Z\s]+)',  # Matches "By: Name"
+    r'[Nn]ame:?\s+([A-Z][a-zA-Z\s]+)',  # Matches "Name: Full Name"
+)]
+
+# Institute patterns used by extract_title_info, in order of preference
+_INSTITUTE_PATTERNS = [re.compile(p) for p in (
+    r'(University of Colorado Boulder)',
+    r'(Colorado Boulder)',
+    r'(University of [A-Z][a-zA-Z\s]+)',
+    r'([A-Z][a-zA-Z\s]+ University)',
+    r'([A-Z][a-zA-Z\s]+ College)',
+    r'([A-Z][a-zA-Z\s]+ Institute)',
+)]
+
+# Generic section headers never used as the presentation subtitle
+_SUBTITLE_DENYLIST = frozenset({
+    'problem statement', 'objectives', 'introduction',
+    'the dataset', 'eda', 'models', 'deliverables'
+})
+
+# Template placeholder such as {{TITLE}}
+_RE_PLACEHOLDER = re.compile(r'\{\{(\w+)\}\}')
+
+# Content extracted from a notebook by extract_all
+CellBundle = namedtuple('CellBundle', ['markdown_cells', 'code_cells', 'images'])
+
+# Everything a classify_cell handler needs besides the cell itself
+_CellState = namedtuple('_CellState', ['bundle', 'figures_dir', 'executor', 'cell_cache'])
 
 # University Theme Definitions
 UNIVERSITY_THEMES = {
@@ -83,13 +194,14 @@ UNIVERSITY_THEMES = {
 
 def ensure_logo_exists(theme, script_dir):
     """Ensure logo file exists, create placeholder if needed."""
-    logo_filename = UNIVERSITY_THEMES[theme]['logo']
+    theme_config = UNIVERSITY_THEMES[theme]
+    logo_filename = theme_config['logo']
     logo_path = script_dir / 'assets' / 'logos' / logo_filename
 
     if not logo_path.exists():
         # Create a simple SVG placeholder logo
-        university_name = UNIVERSITY_THEMES[theme]['name']
-        primary = UNIVERSITY_THEMES[theme]['primary']
+        university_name = theme_config['name']
+        primary = theme_config['primary']
 
         svg_content = f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg width="300" height="300" xmlns="http://www.w3.org/2000/svg">
@@ -106,19 +218,27 @@ def ensure_logo_exists(theme, script_dir):
   </text>
 </svg>'''
 
-        # Save as SVG (LaTeX can include SVG directly with proper packages)
+        # Save as SVG (LaTeX can include SVG directly with proper packages).
+        # Leave an identical placeholder untouched so its mtime, and the logo
+        # manifest built from it, stays the same between runs.
         svg_logo_path = logo_path.with_suffix('.svg')
-        with open(svg_logo_path, 'w') as f:
-            f.write(svg_content)
+        try:
+            with open(svg_logo_path, 'r') as f:
+                unchanged = f.read() == svg_content
+        except FileNotFoundError:
+            unchanged = False
+        if not unchanged:
+            with open(svg_logo_path, 'w') as f:
+                f.write(svg_content)
 
         return logo_filename.replace('.png', '.svg')
 
     return logo_filename
 
 
-def extract_markdown_cells(notebook_path):
+def load_notebook(notebook_path):
     """
-    Extract markdown cells from Jupyter notebook.
+    Parse a Jupyter notebook file, with orjson when it is installed.
 
     Parameters:
     -----------
@@ -127,148 +247,392 @@ def extract_markdown_cells(notebook_path):
 
     Returns:
     --------
-    list of dict
-        List of markdown cells with metadata
+    dict
+        Parsed notebook
     """
+    with open(notebook_path, 'rb') as f:
+        if orjson is None:
+            return json.load(f)
+
+        # orjson parses straight from the mapped file, without an intermediate copy
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return orjson.loads(f.read())
+        with mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def iter_notebook_cells(notebook):
+    """
+    Iterate over the cells of a Jupyter notebook, parsing the file only once.
+
+    Notebooks larger than NOTEBOOK_STREAMING_THRESHOLD are streamed cell by
+    cell with ijson (when installed), so embedded base64 images are only held
+    in memory while the cell they belong to is being processed.
+
+    Parameters:
+    -----------
+    notebook : str or dict
+        Path to the Jupyter notebook file, or a notebook already parsed
+        with load_notebook
+
+    Yields:
+    -------
+    tuple of (int, dict)
+        Cell index and raw notebook cell
+    """
+    if not isinstance(notebook, dict):
+        if os.path.getsize(notebook) >= NOTEBOOK_STREAMING_THRESHOLD:
+            # ijson is only imported for notebooks large enough to stream
+            try:
+                import ijson
+            except ImportError:
+                pass
+            else:
+                with open(notebook, 'rb') as f:
+                    yield from _prepare_cells(ijson.items(f, 'cells.item'))
+                return
+
+        notebook = load_notebook(notebook)
+
+    yield from _prepare_cells(notebook['cells'])
+
+
+def _prepare_cells(cells):
+    """
+    Enumerate cells, caching the joined source on each one.
+
+    The source is stored as cell['_source'] and, for code cells, its line
+    count as cell['_nlines'], so downstream extractors never re-join it.
+    """
+    for cell_idx, cell in enumerate(cells):
+        source = ''.join(cell.get('source', []))
+        cell['_source'] = source
+        if cell.get('cell_type') == 'code':
+            cell['_nlines'] = source.count('\n') + 1
+        yield cell_idx, cell
+
+
+def _load_json_cache(cache_path):
+    """Load a JSON cache file, returning an empty dict if it is missing or corrupt."""
     try:
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
-    except FileNotFoundError:
-        print(f"Warning: Notebook '{notebook_path}' not found.")
-        return []
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
 
-    markdown_cells = []
 
-    for cell_idx, cell in enumerate(notebook['cells']):
-        if cell.get('cell_type') == 'markdown':
-            # Join all source lines
-            content = ''.join(cell.get('source', []))
+def _save_json_cache(cache_path, cache):
+    """Write a cache loaded with _load_json_cache back to disk."""
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
 
-            markdown_cells.append({
-                'cell_index': cell_idx,
-                'content': content,
-                'type': 'markdown'
-            })
-            print(f"  Extracted markdown cell {cell_idx}")
 
-    return markdown_cells
+def _is_cached(cell_cache, filepath, data):
+    """
+    Return True if filepath exists and was last written from data.
+
+    data is a str, bytes, or list of str (as notebooks store image data).
+    The hash of data is recorded under filepath in cell_cache either way.
+    Always returns False when cell_cache is None.
+    """
+    if cell_cache is None:
+        return False
 
+    digest = hashlib.blake2b(digest_size=16)
+    for piece in (data if isinstance(data, list) else [data]):
+        digest.update(piece.encode('utf-8') if isinstance(piece, str) else piece)
+    digest = digest.hexdigest()
 
-def extract_code_cells(notebook_path):
+    cached = cell_cache.get(filepath) == digest
+    cell_cache[filepath] = digest
+    return cached and os.path.exists(filepath)
+
+
+def _extract_markdown_cell(cell_idx, cell, markdown_cells):
+    """Append a markdown cell to markdown_cells."""
+    content = cell['_source']
+
+    markdown_cells.append({
+        'cell_index': cell_idx,
+        'content': content,
+        'type': 'markdown'
+    })
+    print(f"  Extracted markdown cell {cell_idx}")
+
+
+def _extract_code_cell(cell_idx, cell, code_cells):
+    """Append a code cell to code_cells, skipping empty cells."""
+    content = cell['_source']
+
+    # Skip empty cells
+    if content.strip():
+        code_cells.append({
+            'cell_index': cell_idx,
+            'content': content,
+            'num_lines': cell['_nlines'],
+            'type': 'code'
+        })
+        print(f"  Extracted code cell {cell_idx}")
+
+
+def _extract_cell_images(cell_idx, cell, images, output_dir, executor=None, cell_cache=None):
     """
-    Extract code cells from Jupyter notebook.
+    Save the images embedded in a code cell's outputs and append them to images.
+
+    When an executor is given, the images are decoded and written on it and
+    the pending futures are returned; otherwise they are written immediately.
+    Images already on disk with the same data according to cell_cache are
+    not written again.
+    """
+    pending_writes = []
+
+    # Get cell source to understand context
+    cell_source = cell['_source']
+
+    # Check outputs
+    for output in cell.get('outputs', []):
+        # Look for display_data or execute_result with images
+        if output.get('output_type') in ['display_data', 'execute_result']:
+            data = output.get('data', {})
+
+            # Extract PNG/JPEG images, one per output
+            mime_type = next((mime for mime in IMAGE_MIME_TYPES if mime in data), None)
+            if mime_type:
+                image_counter = len(images) + 1
+
+                # Images are named generically (see infer_plot_type)
+                filename = f"figure_{image_counter:03d}.{IMAGE_MIME_TYPES[mime_type]}"
+
+                filepath = os.path.join(output_dir, filename)
+
+                # Decode base64 straight to disk, unless the same image is already there
+                if not _is_cached(cell_cache, filepath, data[mime_type]):
+                    if executor is None:
+                        _decode_base64_to_file(data[mime_type], filepath)
+                    else:
+                        pending_writes.append(executor.submit(_decode_base64_to_file, data[mime_type], filepath))
+
+                images.append({
+                    'filename': filename,
+                    'filepath': filepath,
+                    'cell_index': cell_idx,
+                    'plot_type': None,
+                    'cell_source': cell_source[:200]  # First 200 chars for context
+                })
+
+                print(f"  Extracted: {filename}")
+
+    return pending_writes
+
+
+def _decode_base64_to_file(image_data, filepath):
+    """
+    Decode base64 image data into filepath, BASE64_CHUNK_SIZE characters at a time.
+
+    Only one chunk of decoded bytes is held in memory at once, rather than a
+    full decoded copy of the image next to its base64 text. image_data may be
+    a string or, as nbformat allows for multiline values, a list of lines.
+    """
+    if isinstance(image_data, list):
+        image_data = ''.join(line.strip() for line in image_data)
+
+    # Chunks must stay aligned to 4-character base64 groups, so drop any
+    # line breaks inside the payload (a trailing newline is harmless)
+    if _RE_WHITESPACE.search(image_data, 0, len(image_data) - 1):
+        image_data = ''.join(image_data.split())
+
+    with open(filepath, 'wb') as img_file:
+        for start in range(0, len(image_data), BASE64_CHUNK_SIZE):
+            img_file.write(_b64.b64decode(image_data[start:start + BASE64_CHUNK_SIZE], validate=False))
+
+
+def _handle_markdown_cell(cell_idx, cell, state):
+    """classify_cell handler for markdown cells."""
+    _extract_markdown_cell(cell_idx, cell, state.bundle.markdown_cells)
+    return []
+
+
+def _handle_code_cell(cell_idx, cell, state):
+    """classify_cell handler for code cells; returns the pending image writes."""
+    _extract_code_cell(cell_idx, cell, state.bundle.code_cells)
+    return _extract_cell_images(cell_idx, cell, state.bundle.images, state.figures_dir,
+                                state.executor, state.cell_cache)
+
+
+# classify_cell handlers by cell type; other cell types (e.g. raw) are skipped
+_CELL_HANDLERS = {
+    'markdown': _handle_markdown_cell,
+    'code': _handle_code_cell,
+}
+
+
+def classify_cell(cell_idx, cell, markdown_cells, code_cells, images, figures_dir, executor=None, cell_cache=None):
+    """
+    Sort a single notebook cell into the markdown, code, and image lists.
 
     Parameters:
     -----------
-    notebook_path : str
-        Path to the Jupyter notebook file
+    cell_idx : int
+        Index of the cell in the notebook
+    cell : dict
+        Raw notebook cell
+    markdown_cells, code_cells, images : list of dict
+        Lists the extracted content is appended to
+    figures_dir : str
+        Directory to save extracted images
+    executor : concurrent.futures.Executor, optional
+        Executor to write images on; images are written immediately if omitted
+    cell_cache : dict, optional
+        Content hashes by file path from the last run (see CELL_CACHE_FILE);
+        unchanged images are not rewritten, and it is updated in place
 
     Returns:
     --------
-    list of dict
-        List of code cells with metadata
+    list of Future
+        Image writes still pending on the executor
     """
-    try:
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
-    except FileNotFoundError:
-        print(f"Warning: Notebook '{notebook_path}' not found.")
+    state = _CellState(CellBundle(markdown_cells, code_cells, images), figures_dir, executor, cell_cache)
+    return _dispatch_cell(cell_idx, cell, state)
+
+
+def _dispatch_cell(cell_idx, cell, state):
+    """Pass a cell to its _CELL_HANDLERS entry and return the pending image writes."""
+    handler = _CELL_HANDLERS.get(cell.get('cell_type'))
+    if handler is None:
         return []
 
-    code_cells = []
+    return handler(cell_idx, cell, state)
 
-    for cell_idx, cell in enumerate(notebook['cells']):
-        if cell.get('cell_type') == 'code':
-            # Join all source lines
-            content = ''.join(cell.get('source', []))
 
-            # Skip empty cells
-            if content.strip():
-                code_cells.append({
-                    'cell_index': cell_idx,
-                    'content': content,
-                    'type': 'code'
-                })
-                print(f"  Extracted code cell {cell_idx}")
+def extract_all(notebook, figures_dir, cell_cache=None):
+    """
+    Extract markdown cells, code cells, and images in a single pass over the notebook.
 
-    return code_cells
+    Images are decoded and written on a thread pool while the remaining
+    cells are processed.
 
+    Parameters:
+    -----------
+    notebook : str or dict
+        Path to the Jupyter notebook file, or a notebook already parsed
+        with load_notebook
+    figures_dir : str
+        Directory to save extracted images
+    cell_cache : dict, optional
+        Content hashes by file path from the last run (see CELL_CACHE_FILE);
+        unchanged images are not rewritten, and it is updated in place
 
-def extract_images_from_notebook(notebook_path, output_dir='presentation/figures'):
+    Returns:
+    --------
+    CellBundle
+        Extracted markdown cells, code cells, and images
     """
-    Extract all images from Jupyter notebook outputs.
+    os.makedirs(figures_dir, exist_ok=True)
+
+    bundle = CellBundle(markdown_cells=[], code_cells=[], images=[])
+
+    with ThreadPoolExecutor(max_workers=FILE_WRITE_WORKERS) as executor:
+        state = _CellState(bundle, figures_dir, executor, cell_cache)
+        pending_writes = []
+        add_pending = pending_writes.extend
+        for cell_idx, cell in iter_notebook_cells(notebook):
+            add_pending(_dispatch_cell(cell_idx, cell, state))
+
+        # Surface any error raised while writing an image
+        for future in pending_writes:
+            future.result()
+
+    return bundle
+
+
+def extract_markdown_cells(notebook):
+    """
+    Extract markdown cells from Jupyter notebook.
 
     Parameters:
     -----------
-    notebook_path : str
-        Path to the Jupyter notebook file
-    output_dir : str
-        Directory to save extracted images
+    notebook : str or dict
+        Path to the Jupyter notebook file, or a notebook already parsed
+        with load_notebook
 
     Returns:
     --------
     list of dict
-        List of extracted images with metadata
+        List of markdown cells with metadata
     """
-    # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
+    markdown_cells = []
 
-    # Load notebook
     try:
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
+        for cell_idx, cell in iter_notebook_cells(notebook):
+            if cell.get('cell_type') == 'markdown':
+                _extract_markdown_cell(cell_idx, cell, markdown_cells)
     except FileNotFoundError:
-        print(f"Warning: Notebook '{notebook_path}' not found.")
+        print(f"Warning: Notebook '{notebook}' not found.")
         return []
 
-    extracted_images = []
-    image_counter = 0
+    return markdown_cells
 
-    # Iterate through cells
-    for cell_idx, cell in enumerate(notebook['cells']):
-        if cell.get('cell_type') != 'code':
-            continue
 
-        # Get cell source to understand context
-        cell_source = ''.join(cell.get('source', []))
+def extract_code_cells(notebook):
+    """
+    Extract code cells from Jupyter notebook.
 
-        # Check outputs
-        for output in cell.get('outputs', []):
-            # Look for display_data or execute_result with images
-            if output.get('output_type') in ['display_data', 'execute_result']:
-                data = output.get('data', {})
+    Parameters:
+    -----------
+    notebook : str or dict
+        Path to the Jupyter notebook file, or a notebook already parsed
+        with load_notebook
 
-                # Extract PNG images
-                if 'image/png' in data:
-                    image_counter += 1
-                    image_data = data['image/png']
+    Returns:
+    --------
+    list of dict
+        List of code cells with metadata
+    """
+    code_cells = []
 
-                    # Decode base64
-                    image_bytes = base64.b64decode(image_data)
+    try:
+        for cell_idx, cell in iter_notebook_cells(notebook):
+            if cell.get('cell_type') == 'code':
+                _extract_code_cell(cell_idx, cell, code_cells)
+    except FileNotFoundError:
+        print(f"Warning: Notebook '{notebook}' not found.")
+        return []
 
-                    # Generate descriptive filename based on context
-                    filename = f"figure_{image_counter:03d}.png"
+    return code_cells
 
-                    # Try to infer what the plot shows
-                    plot_type = infer_plot_type(cell_source, image_counter)
-                    if plot_type:
-                        filename = f"{plot_type}_{image_counter:03d}.png"
 
-                    filepath = os.path.join(output_dir, filename)
+def extract_images_from_notebook(notebook, output_dir='presentation/figures'):
+    """
+    Extract all images from Jupyter notebook outputs.
+
+    Parameters:
+    -----------
+    notebook : str or dict
+        Path to the Jupyter notebook file, or a notebook already parsed
+        with load_notebook
+    output_dir : str
+        Directory to save extracted images
 
-                    # Save image
-                    with open(filepath, 'wb') as img_file:
-                        img_file.write(image_bytes)
+    Returns:
+    --------
+    list of dict
+        List of extracted images with metadata
+    """
+    # Create output directory
+    os.makedirs(output_dir, exist_ok=True)
 
-                    extracted_images.append({
-                        'filename': filename,
-                        'filepath': filepath,
-                        'cell_index': cell_idx,
-                        'plot_type': plot_type,
-                        'cell_source': cell_source[:200]  # First 200 chars for context
-                    })
+    extracted_images = []
 
-                    print(f"  Extracted: {filename}")
+    try:
+        for cell_idx, cell in iter_notebook_cells(notebook):
+            if cell.get('cell_type') == 'code':
+                _extract_cell_images(cell_idx, cell, extracted_images, output_dir)
+    except FileNotFoundError:
+        print(f"Warning: Notebook '{notebook}' not found.")
+        return []
 
     return extracted_images
 
@@ -278,7 +642,8 @@ def infer_plot_type(cell_source, counter):
     Placeholder for plot type inference.
 
     This function intentionally returns None to keep the script generic.
-    Images are named generically as figure_001.png, figure_002.png, etc.
+    Images are named generically as figure_001.png, figure_002.png, etc.,
+    so the extractor no longer calls it; it is kept for API compatibility.
 
     Parameters:
     -----------
@@ -295,10 +660,62 @@ def infer_plot_type(cell_source, counter):
     return None
 
 
+def _convert_inline(text):
+    """Escape special LaTeX characters and convert inline markdown to LaTeX commands."""
+    parts = []
+    pos = 0
+
+    for match in _RE_INLINE.finditer(text):
+        # Plain text between tokens only needs escaping
+        parts.append(text[pos:match.start()].translate(_LATEX_ESCAPE))
+        parts.append(_inline_token_to_latex(match))
+        pos = match.end()
+
+    parts.append(text[pos:].translate(_LATEX_ESCAPE))
+
+    return ''.join(parts)
+
+
+def _inline_token_to_latex(match):
+    """Convert a single _RE_INLINE match to LaTeX, converting nested formatting."""
+    kind = match.lastgroup
+
+    if kind == 'header':
+        command = 'textbf' if len(match.group('level')) == 4 else 'textit'
+        return f"\\{command}{{{_convert_inline(match.group('header'))}}}\\\\"
+    if kind == 'bolditalic':
+        return f"\\textbf{{\\textit{{{_convert_inline(match.group('bolditalic'))}}}}}"
+    if kind == 'bold':
+        return f"\\textbf{{{_convert_inline(match.group('bold'))}}}"
+    if kind == 'italic':
+        return f"\\textit{{{_convert_inline(match.group('italic'))}}}"
+    if kind == 'code':
+        return f"\\texttt{{{match.group('code').translate(_LATEX_ESCAPE)}}}"
+
+    url = match.group('link_url').translate(_LATEX_ESCAPE)
+    return f"\\href{{{url}}}{{{_convert_inline(match.group('link_text'))}}}"
+
+
+def _list_block_sub(match):
+    """Convert a block of markdown list items to a LaTeX itemize environment."""
+    block = match.group(0)
+    trailing_newline = block.endswith('\n')
+    if trailing_newline:
+        block = block[:-1]
+
+    # Remove the list marker from each line and add \item
+    items = ''.join(f"    \\item {line.strip()[2:].strip()}\n" for line in block.split('\n'))
+
+    return f"\\begin{{itemize}}\n{items}\\end{{itemize}}" + ('\n' if trailing_newline else '')
+
+
+@functools.lru_cache(maxsize=2048)
 def markdown_to_latex(markdown_text):
     """
     Convert markdown text to LaTeX format.
 
+    The conversion is pure, so results are memoized for repeated snippets.
+
     Parameters:
     -----------
     markdown_text : str
@@ -316,82 +733,32 @@ def markdown_to_latex(markdown_text):
     if not text:
         return None
 
-    # First convert headers BEFORE any other processing
-    text = re.sub(r'^#####\s+(.*?)$', r'<<<H5>>>\1<<<ENDH5>>>', text, flags=re.MULTILINE)
-    text = re.sub(r'^####\s+(.*?)$', r'<<<H4>>>\1<<<ENDH4>>>', text, flags=re.MULTILINE)
+    # Escape special LaTeX characters and convert H4/H5 headers and
+    # bold/italic/code/links straight to LaTeX in one pass
+    text = _convert_inline(text)
 
-    # Convert bold/italic/links BEFORE escaping
-    text = re.sub(r'\*\*(.*?)\*\*', r'<<<BOLD>>>\1<<<ENDBOLD>>>', text)
-    text = re.sub(r'\*(.*?)\*', r'<<<ITALIC>>>\1<<<ENDITALIC>>>', text)
-    text = re.sub(r'`(.*?)`', r'<<<CODE>>>\1<<<ENDCODE>>>', text)
-    text = re.sub(r'\[(.*?)\]\((.*?)\)', r'<<<LINK>>>\2<<<LINKTEXT>>>\1<<<ENDLINK>>>', text)
+    # Convert markdown lists to LaTeX itemize and drop blank lines
+    text = _RE_LIST_BLOCK.sub(_list_block_sub, text)
+    text = _RE_BLANK_LINES.sub('', text)
 
-    # Escape special LaTeX characters EXCEPT those in our placeholders
-    replacements = {
-        '&': r'\&',
-        '%': r'\%',
-        '$': r'\$',
-        '#': r'\#',
-        '_': r'\_',
-        '{': r'\{',
-        '}': r'\}',
-    }
-
-    for char, replacement in replacements.items():
-        text = text.replace(char, replacement)
-
-    # Now convert placeholders to LaTeX commands
-    text = text.replace('<<<H5>>>', r'\textit{')
-    text = text.replace('<<<ENDH5>>>', r'}\\')
-    text = text.replace('<<<H4>>>', r'\textbf{')
-    text = text.replace('<<<ENDH4>>>', r'}\\')
-    text = text.replace('<<<BOLD>>>', r'\textbf{')
-    text = text.replace('<<<ENDBOLD>>>', '}')
-    text = text.replace('<<<ITALIC>>>', r'\textit{')
-    text = text.replace('<<<ENDITALIC>>>', '}')
-    text = text.replace('<<<CODE>>>', r'\texttt{')
-    text = text.replace('<<<ENDCODE>>>', '}')
-    text = text.replace('<<<LINK>>>', r'\href{')
-    text = text.replace('<<<LINKTEXT>>>', '}{')
-    text = text.replace('<<<ENDLINK>>>', '}')
-
-    # Convert headers (should already be removed at frame level, but just in case)
-    text = re.sub(r'^####\s+(.*?)$', r'\\textbf{\1}', text, flags=re.MULTILINE)
-    text = re.sub(r'^###\s+(.*?)$', r'\\subsection{\1}', text, flags=re.MULTILINE)
-    text = re.sub(r'^##\s+(.*?)$', r'\\section{\1}', text, flags=re.MULTILINE)
-    text = re.sub(r'^#\s+(.*?)$', r'\\section{\1}', text, flags=re.MULTILINE)
-
-    # Convert markdown lists to LaTeX itemize
-    lines = text.split('\n')
-    result_lines = []
-    in_list = False
-
-    for line in lines:
-        stripped = line.strip()
-
-        # Check if this is a list item
-        if stripped.startswith('- ') or stripped.startswith('* '):
-            if not in_list:
-                result_lines.append('\\begin{itemize}')
-                in_list = True
-            # Remove the list marker and add \item
-            content = stripped[2:].strip()
-            result_lines.append(f'    \\item {content}')
-        else:
-            # Not a list item
-            if in_list:
-                result_lines.append('\\end{itemize}')
-                in_list = False
-            if stripped:  # Only add non-empty lines
-                result_lines.append(line)
+    return text
 
-    # Close list if still open
-    if in_list:
-        result_lines.append('\\end{itemize}')
 
-    text = '\n'.join(result_lines)
+def _find_first_match(markdown_cells, patterns):
+    """
+    Return the first group of the most preferred pattern matching a markdown cell.
 
-    return text
+    Each pattern, in order of preference, is tried on the cells one at a time
+    and the search stops at the first cell it matches. A weaker pattern is
+    only tried once no cell matches any stronger one, so "Author: Name" in a
+    later cell still beats "by ..." in an earlier one.
+    """
+    for pattern in patterns:
+        for cell in markdown_cells:
+            match = pattern.search(cell['content'])
+            if match:
+                return match.group(1).strip()
+    return None
 
 
 def extract_title_info(markdown_cells):
@@ -406,9 +773,6 @@ def extract_title_info(markdown_cells):
 
     # Try to extract from all markdown cells
     if markdown_cells:
-        # Combine all markdown content for better extraction
-        all_content = '\n'.join([cell['content'] for cell in markdown_cells])
-
         # Extract from first cell
         first_cell = markdown_cells[0]['content']
         lines = first_cell.split('\n')
@@ -419,52 +783,26 @@ def extract_title_info(markdown_cells):
 
             # Look for H1 or H2 for title (first occurrence)
             if line_stripped.startswith('## ') and not title_found:
-                title = line_stripped.lstrip('## ').strip()
+                title = line_stripped[3:].strip()
                 title_found = True
             elif line_stripped.startswith('# ') and not title_found:
-                title = line_stripped.lstrip('# ').strip()
+                title = line_stripped[2:].strip()
                 title_found = True
             # Look for H3 or H4 for subtitle (but skip common ones like "Problem Statement")
             elif line_stripped.startswith('### ') and title_found and not subtitle:
-                potential_subtitle = line_stripped.lstrip('### ').strip()
+                potential_subtitle = line_stripped[4:].strip()
                 # Skip generic section headers
-                if potential_subtitle.lower() not in ['problem statement', 'objectives', 'introduction',
-                                                        'the dataset', 'eda', 'models', 'deliverables']:
+                if potential_subtitle.lower() not in _SUBTITLE_DENYLIST:
                     subtitle = potential_subtitle
 
-        # Search for author name in all content (look for name patterns)
-        # Pattern: "I, **Name**," or "by Name" or "Author: Name"
-        author_patterns = [
-            r'I,?\s+\*\*([^*]+)\*\*,',  # Matches "I, **Name**,"
-            r'[Aa]uthor:?\s+([A-Z][a-zA-Z\s]+)',  # Matches "Author: Name"
-            r'[Bb]y:?\s+([A-Z][a-zA-Z\s]+)',  # Matches "By: Name"
-            r'[Nn]ame:?\s+([A-Z][a-zA-Z\s]+)',  # Matches "Name: Full Name"
-        ]
-
-        for pattern in author_patterns:
-            match = re.search(pattern, all_content)
-            if match:
-                author = match.group(1).strip()
-                break
-
-        # Search for institute/university in all content
-        institute_patterns = [
-            r'(University of Colorado Boulder)',
-            r'(Colorado Boulder)',
-            r'(University of [A-Z][a-zA-Z\s]+)',
-            r'([A-Z][a-zA-Z\s]+ University)',
-            r'([A-Z][a-zA-Z\s]+ College)',
-            r'([A-Z][a-zA-Z\s]+ Institute)',
-        ]
-
-        for pattern in institute_patterns:
-            match = re.search(pattern, all_content)
-            if match:
-                institute = match.group(1).strip()
-                # Normalize "Colorado Boulder" to full name
-                if institute == "Colorado Boulder":
-                    institute = "University of Colorado Boulder"
-                break
+        # Search for author name, one cell at a time (look for name patterns)
+        author = _find_first_match(markdown_cells, _AUTHOR_PATTERNS) or author
+
+        # Search for institute/university, one cell at a time
+        institute = _find_first_match(markdown_cells, _INSTITUTE_PATTERNS) or institute
+        # Normalize "Colorado Boulder" to full name
+        if institute == "Colorado Boulder":
+            institute = "University of Colorado Boulder"
 
     return {
         'title': title,
@@ -474,15 +812,25 @@ def extract_title_info(markdown_cells):
     }
 
 
+@functools.lru_cache(maxsize=None)
+def _read_template(template_path):
+    """Read a template file; cached so each template is read from disk only once per process."""
+    return Path(template_path).read_text(encoding='utf-8')
+
+
+@functools.lru_cache(maxsize=None)
 def load_template(script_dir, theme):
-    """Load and populate the LaTeX template with theme-specific values."""
+    """
+    Load and populate the LaTeX template with theme-specific values.
+
+    The populated template is cached per (script_dir, theme).
+    """
     template_path = script_dir / 'templates' / 'beamer_template.tex'
 
     if not template_path.exists():
         raise FileNotFoundError(f"Template not found: {template_path}")
 
-    with open(template_path, 'r') as f:
-        template = f.read()
+    template = _read_template(str(template_path))
 
     # Get theme configuration
     theme_config = UNIVERSITY_THEMES.get(theme, UNIVERSITY_THEMES['cu'])
@@ -492,26 +840,34 @@ def load_template(script_dir, theme):
 
     # Populate placeholders
     replacements = {
-        '{{UNIVERSITY_NAME}}': theme_config['name'],
-        '{{PRIMARY_R}}': str(theme_config['primary'][0]),
-        '{{PRIMARY_G}}': str(theme_config['primary'][1]),
-        '{{PRIMARY_B}}': str(theme_config['primary'][2]),
-        '{{SECONDARY_R}}': str(theme_config['secondary'][0]),
-        '{{SECONDARY_G}}': str(theme_config['secondary'][1]),
-        '{{SECONDARY_B}}': str(theme_config['secondary'][2]),
-        '{{TERTIARY_R}}': str(theme_config['tertiary'][0]),
-        '{{TERTIARY_G}}': str(theme_config['tertiary'][1]),
-        '{{TERTIARY_B}}': str(theme_config['tertiary'][2]),
-        '{{QUATERNARY_R}}': str(theme_config['quaternary'][0]),
-        '{{QUATERNARY_G}}': str(theme_config['quaternary'][1]),
-        '{{QUATERNARY_B}}': str(theme_config['quaternary'][2]),
-        '{{LOGO_FILE}}': logo_file
+        'UNIVERSITY_NAME': theme_config['name'],
+        'LOGO_FILE': logo_file
     }
+    for color in ('primary', 'secondary', 'tertiary', 'quaternary'):
+        for channel, value in zip('RGB', theme_config[color]):
+            replacements[f'{color.upper()}_{channel}'] = str(value)
+
+    return fill_placeholders(template, replacements)
 
-    for placeholder, value in replacements.items():
-        template = template.replace(placeholder, value)
 
-    return template
+def fill_placeholders(template, replacements):
+    """
+    Replace {{NAME}} placeholders in a template in a single pass.
+
+    Parameters:
+    -----------
+    template : str
+        Template text
+    replacements : dict
+        Placeholder names (without braces) mapped to their values;
+        placeholders not in the dict are left untouched
+
+    Returns:
+    --------
+    str
+        Template with placeholders replaced
+    """
+    return _RE_PLACEHOLDER.sub(lambda match: replacements.get(match.group(1), match.group(0)), template)
 
 
 def generate_beamer_with_content(images, markdown_cells, code_cells, theme='cu', script_dir=None):
@@ -548,14 +904,9 @@ def generate_beamer_with_content(images, markdown_cells, code_cells, theme='cu',
 
     template = load_template(script_dir, theme)
 
-    # Populate title information
+    # Build the subtitle command, if any
     subtitle_line = f"\\subtitle{{{title_info['subtitle']}}}" if title_info['subtitle'] else ""
 
-    template = template.replace('{{TITLE}}', title_info['title'])
-    template = template.replace('{{SUBTITLE}}', subtitle_line)
-    template = template.replace('{{AUTHOR}}', title_info['author'])
-    template = template.replace('{{INSTITUTE}}', title_info['institute'])
-
     # Create mappings by cell index for proper ordering
     images_by_cell = {}
     for img in images:
@@ -570,20 +921,21 @@ def generate_beamer_with_content(images, markdown_cells, code_cells, theme='cu',
         cell_idx = code['cell_index']
         code_by_cell[cell_idx] = code
 
-    # Build content section
-    content_latex = ""
+    # Create mapping for markdown cells
+    md_by_cell = {mc['cell_index']: mc for mc in markdown_cells}
+
+    # Build content section as a list of fragments, joined once at the end
+    parts = []
 
     # Create a unified timeline of all cells (markdown, code, images)
-    # We'll process cells in order and add appropriate frames
-    all_cell_indices = set()
-    all_cell_indices.update([mc['cell_index'] for mc in markdown_cells])
-    all_cell_indices.update([cc['cell_index'] for cc in code_cells])
-    all_cell_indices.update(images_by_cell.keys())
+    # We'll process cells in order and add appropriate frames. Each mapping
+    # is already in notebook order, so merge them rather than sort a set.
+    all_cell_indices = dict.fromkeys(heapq.merge(md_by_cell, code_by_cell, images_by_cell))
 
     # Process cells in order
-    for cell_idx in sorted(all_cell_indices):
+    for cell_idx in all_cell_indices:
         # Check if this is a markdown cell
-        md_cell = next((mc for mc in markdown_cells if mc['cell_index'] == cell_idx), None)
+        md_cell = md_by_cell.get(cell_idx)
         if md_cell:
             content = md_cell['content'].strip()
             if content:
@@ -601,41 +953,41 @@ def generate_beamer_with_content(images, markdown_cells, code_cells, theme='cu',
                     if line_stripped.startswith('## '):
                         # Close previous frame if open
                         if in_frame and current_frame_content:
-                            content_latex += convert_markdown_to_frame(current_frame_title, '\n'.join(current_frame_content))
+                            parts.append(convert_markdown_to_frame(current_frame_title, '\n'.join(current_frame_content)))
                             current_frame_content = []
 
                         # Add section
-                        section_title = line_stripped.lstrip('## ').strip()
-                        content_latex += f"\n\\section{{{section_title}}}\n\n"
+                        section_title = line_stripped[3:].strip()
+                        parts.append(f"\n\\section{{{section_title}}}\n\n")
                         in_frame = False
                         current_frame_title = None
 
                     elif line_stripped.startswith('### '):
                         # Close previous frame if open
                         if in_frame and current_frame_content:
-                            content_latex += convert_markdown_to_frame(current_frame_title, '\n'.join(current_frame_content))
+                            parts.append(convert_markdown_to_frame(current_frame_title, '\n'.join(current_frame_content)))
                             current_frame_content = []
 
                         # Start new frame with this as title
-                        current_frame_title = line_stripped.lstrip('### ').strip()
+                        current_frame_title = line_stripped[4:].strip()
                         in_frame = True
 
                     elif line_stripped.startswith('# '):
                         # Close previous frame if open
                         if in_frame and current_frame_content:
-                            content_latex += convert_markdown_to_frame(current_frame_title, '\n'.join(current_frame_content))
+                            parts.append(convert_markdown_to_frame(current_frame_title, '\n'.join(current_frame_content)))
                             current_frame_content = []
 
                         # Add section
-                        section_title = line_stripped.lstrip('# ').strip()
-                        content_latex += f"\n\\section{{{section_title}}}\n\n"
+                        section_title = line_stripped[2:].strip()
+                        parts.append(f"\n\\section{{{section_title}}}\n\n")
                         in_frame = False
                         current_frame_title = None
 
                     elif line_stripped.startswith('---'):
                         # Separator - close frame if open
                         if in_frame and current_frame_content:
-                            content_latex += convert_markdown_to_frame(current_frame_title, '\n'.join(current_frame_content))
+                            parts.append(convert_markdown_to_frame(current_frame_title, '\n'.join(current_frame_content)))
                             current_frame_content = []
                             in_frame = False
                             current_frame_title = None
@@ -652,19 +1004,22 @@ def generate_beamer_with_content(images, markdown_cells, code_cells, theme='cu',
 
                 # Close final frame if open
                 if in_frame and current_frame_content:
-                    content_latex += convert_markdown_to_frame(current_frame_title, '\n'.join(current_frame_content))
+                    parts.append(convert_markdown_to_frame(current_frame_title, '\n'.join(current_frame_content)))
 
         # Check if this is a code cell
         if cell_idx in code_by_cell:
             code_cell = code_by_cell[cell_idx]
             # Add a frame with the code
             filename = f"cell_{cell_idx:03d}.py"
-            num_lines = code_cell['content'].count('\n') + 1
+            # Cells from the extractors carry num_lines; count it for any others
+            num_lines = code_cell.get('num_lines')
+            if num_lines is None:
+                num_lines = code_cell['content'].count('\n') + 1
 
             # Skip extremely large cells (>200 lines) that would crash LaTeX
             # These are typically class definitions or utility code
             if num_lines > 200:
-                content_latex += f"""
+                parts.append(f"""
 \\begin{{frame}}{{Code: Cell {cell_idx} (Large File - {num_lines} lines)}}
     \\textbf{{Note:}} This code cell is very large and has been excluded from the presentation.
 
@@ -680,10 +1035,10 @@ def generate_beamer_with_content(images, markdown_cells, code_cells, theme='cu',
     \\end{{block}}
 \\end{{frame}}
 
-"""
+""")
             elif num_lines > 50:
                 # For large cells (50-200 lines), use allowframebreaks to split across slides
-                content_latex += f"""
+                parts.append(f"""
 \\begin{{frame}}[fragile,allowframebreaks]{{Code: Cell {cell_idx}}}
     \\begin{{figure}}
         \\CODE{{{filename}}}
@@ -691,10 +1046,10 @@ def generate_beamer_with_content(images, markdown_cells, code_cells, theme='cu',
     \\end{{figure}}
 \\end{{frame}}
 
-"""
+""")
             else:
                 # Normal size cells - single frame
-                content_latex += f"""
+                parts.append(f"""
 \\begin{{frame}}[fragile]{{Code: Cell {cell_idx}}}
     \\begin{{figure}}
         \\CODE{{{filename}}}
@@ -702,27 +1057,30 @@ def generate_beamer_with_content(images, markdown_cells, code_cells, theme='cu',
     \\end{{figure}}
 \\end{{frame}}
 
-"""
+""")
 
         # Check if this cell has images (code outputs)
         if cell_idx in images_by_cell:
             for img in images_by_cell[cell_idx]:
-                plot_type = img.get('plot_type', 'Result')
-                title = plot_type.replace('_', ' ').title() if plot_type else "Analysis Result"
-                caption = title if plot_type else f"Output from Cell {cell_idx}"
-                content_latex += f"""
-\\begin{{frame}}{{{title}}}
+                parts.append(f"""
+\\begin{{frame}}{{Analysis Result}}
     \\begin{{figure}}
         \\centering
         \\includegraphics[width=0.85\\textwidth,height=0.7\\textheight,keepaspectratio]{{assets/figures/{img['filename']}}}
-        \\caption{{{caption}}}
+        \\caption{{Output from Cell {cell_idx}}}
     \\end{{figure}}
 \\end{{frame}}
 
-"""
+""")
 
-    # Insert content into template
-    final_latex = template.replace('{{CONTENT}}', content_latex)
+    # Insert title information and content into template
+    final_latex = fill_placeholders(template, {
+        'TITLE': title_info['title'],
+        'SUBTITLE': subtitle_line,
+        'AUTHOR': title_info['author'],
+        'INSTITUTE': title_info['institute'],
+        'CONTENT': ''.join(parts)
+    })
 
     return final_latex
 
@@ -755,14 +1113,12 @@ def convert_markdown_to_frame(title, content):
     # Build frame
     frame_header = f"\\begin{{frame}}{{{title}}}\n" if title else "\\begin{frame}\n"
 
-    frame = frame_header
-    frame += latex_text + "\n"
-    frame += "\\end{frame}\n\n"
+    frame = [frame_header, latex_text + "\n", "\\end{frame}\n\n"]
 
-    return frame
+    return ''.join(frame)
 
 
-def save_code_cells_to_files(code_cells, output_dir='presentation/code'):
+def save_code_cells_to_files(code_cells, output_dir='presentation/code', cell_cache=None):
     """
     Save code cells to individual Python files for inclusion in LaTeX.
 
@@ -772,6 +1128,9 @@ def save_code_cells_to_files(code_cells, output_dir='presentation/code'):
         List of code cells with content
     output_dir : str
         Directory to save code files
+    cell_cache : dict, optional
+        Content hashes by file path from the last run (see CELL_CACHE_FILE);
+        unchanged files are not rewritten, and it is updated in place
 
     Returns:
     --------
@@ -781,26 +1140,52 @@ def save_code_cells_to_files(code_cells, output_dir='presentation/code'):
     # Create code directory
     os.makedirs(output_dir, exist_ok=True)
 
-    saved_files = []
+    # Write the files concurrently; map() keeps the results in cell order.
+    # The pool never has more threads than files, and at least one.
+    workers = max(1, min(FILE_WRITE_WORKERS, len(code_cells)))
+    output_prefix = os.path.join(os.fspath(output_dir), '')
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        saved_files = list(executor.map(lambda code_cell: _save_code_cell(code_cell, output_prefix, cell_cache), code_cells))
 
-    for code_cell in code_cells:
-        # Create filename based on cell index
-        filename = f"cell_{code_cell['cell_index']:03d}.py"
-        filepath = os.path.join(output_dir, filename)
+    for saved_file in saved_files:
+        print(f"  Saved: {saved_file['filename']}")
 
-        # Save code to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(code_cell['content'])
+    return saved_files
 
-        saved_files.append({
-            'filename': filename,
-            'filepath': filepath,
-            'cell_index': code_cell['cell_index']
-        })
 
-        print(f"  Saved: {filename}")
+def _save_code_cell(code_cell, output_prefix, cell_cache=None):
+    """
+    Save a single code cell to its Python file and return its metadata.
 
-    return saved_files
+    output_prefix is the output directory ending with a path separator, so
+    the file path is built by concatenation instead of os.path.join.
+    """
+    # Create filename based on cell index
+    filename = f"cell_{code_cell['cell_index']:03d}.py"
+    filepath = output_prefix + filename
+
+    # Save code to file, unless it is unchanged since the last run
+    content = code_cell['content'].encode('utf-8')
+    if not _is_cached(cell_cache, filepath, content):
+        _write_bytes(filepath, content)
+
+    return {
+        'filename': filename,
+        'filepath': filepath,
+        'cell_index': code_cell['cell_index']
+    }
+
+
+def _write_bytes(path, data):
+    """Write bytes to path through a raw file descriptor, bypassing text-mode buffering."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        # os.write may write fewer bytes than requested
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def save_presentation(content, output_file='presentation/esg_presentation.tex'):
@@ -808,8 +1193,7 @@ def save_presentation(content, output_file='presentation/esg_presentation.tex'):
     # Create presentation directory if it doesn't exist
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+    _write_bytes(output_file, content.encode('utf-8'))
 
     print(f"✓ Presentation saved to: {output_file}")
 
@@ -825,16 +1209,14 @@ def create_compile_script(output_dir='presentation', script_dir=None):
     if not shell_template_path.exists():
         raise FileNotFoundError(f"Shell script template not found: {shell_template_path}")
 
-    with open(shell_template_path, 'r', encoding='utf-8') as f:
-        shell_script_content = f.read()
+    shell_script_content = _read_template(str(shell_template_path))
 
     # Load batch script template
     batch_template_path = script_dir / 'templates' / 'compile_presentation.bat'
     if not batch_template_path.exists():
         raise FileNotFoundError(f"Batch script template not found: {batch_template_path}")
 
-    with open(batch_template_path, 'r', encoding='utf-8') as f:
-        batch_script_content = f.read()
+    batch_script_content = _read_template(str(batch_template_path))
 
     # Save shell script
     shell_script_path = os.path.join(output_dir, 'compile_presentation.sh')
@@ -850,6 +1232,205 @@ def create_compile_script(output_dir='presentation', script_dir=None):
     print(f"✓ Batch script created: {batch_script_path} (Windows)")
 
 
+def _fast_copytree(src, dst):
+    """
+    Recursively copy src into dst, skipping files that are already up to date.
+
+    A destination file is up to date when it has the same size as the source
+    and is at least as new. Changed files are copied with shutil.copy2, which
+    uses the platform's in-kernel copy where available and preserves the
+    modification time so the next run can skip them.
+    """
+    os.makedirs(dst, exist_ok=True)
+
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+
+            if entry.is_dir():
+                _fast_copytree(entry.path, target)
+                continue
+
+            src_stat = entry.stat()
+            try:
+                dst_stat = os.stat(target)
+            except FileNotFoundError:
+                pass
+            else:
+                if dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime >= src_stat.st_mtime:
+                    continue
+
+            shutil.copy2(entry.path, target)
+
+
+def _tree_manifest(root):
+    """Return a digest of the relative path, size, and mtime of every file under root."""
+    digest = hashlib.blake2b(digest_size=16)
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            stat = os.stat(path)
+            digest.update(f"{os.path.relpath(path, root)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode('utf-8'))
+
+    return digest.hexdigest()
+
+
+def _sync_tree(src, dst):
+    """
+    Copy src into dst unless it is unchanged since the last copy.
+
+    The manifest of src is stored in dst/.manifest; when it matches, the copy
+    is skipped without looking at the destination files at all.
+    """
+    manifest_path = os.path.join(dst, '.manifest')
+    manifest = _tree_manifest(src)
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            if f.read() == manifest:
+                return
+    except FileNotFoundError:
+        pass
+
+    _fast_copytree(src, dst)
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        f.write(manifest)
+
+
+def _find_tool(name, cache_dir):
+    """
+    Return the absolute path of the executable name, or None if it is not on PATH.
+
+    Found paths are cached in cache_dir/TOOL_CACHE_FILE and reused for up to
+    TOOL_CACHE_TTL seconds as long as they still exist. Missing tools are not
+    cached, so a freshly installed compiler is picked up on the next run.
+    """
+    cache_path = os.path.join(cache_dir, TOOL_CACHE_FILE)
+    cache = _load_json_cache(cache_path)
+
+    entry = cache.get(name)
+    if entry and time.time() - entry['time'] < TOOL_CACHE_TTL and os.path.exists(entry['path']):
+        return entry['path']
+
+    path = shutil.which(name)
+    if path:
+        cache[name] = {'path': path, 'time': time.time()}
+        _save_json_cache(cache_path, cache)
+    return path
+
+
+def _run(command, **kwargs):
+    """
+    Run command with subprocess.run after flushing stdout.
+
+    Python block-buffers stdout when it is redirected to a file or CI log, so
+    pending progress messages are flushed first to keep them ahead of the
+    command's own output.
+    """
+    import subprocess
+
+    sys.stdout.flush()
+    return subprocess.run(command, **kwargs)
+
+
+def _open_pdf(pdf_path):
+    """Open pdf_path in the platform's default viewer, if one can be found."""
+    print("\nAttempting to open PDF...")
+    try:
+        if hasattr(os, 'startfile'):
+            os.startfile(pdf_path)
+            return
+
+        opener = shutil.which('open') if sys.platform == 'darwin' else shutil.which('xdg-open')
+        if opener is not None:
+            _run([opener, pdf_path])
+            return
+    except OSError as e:
+        print(f"Could not open the PDF viewer: {e}")
+
+    print(f"Please open {pdf_path} manually.")
+
+
+def _build_hash(latex_content, cell_cache, logo_dir):
+    """
+    Return a digest of everything the PDF is built from.
+
+    This covers the LaTeX source, the content hashes of the code files and
+    images in cell_cache, and the logo files under logo_dir.
+    """
+    digest = hashlib.blake2b(latex_content.encode('utf-8'), digest_size=16)
+    digest.update(json.dumps(cell_cache, sort_keys=True).encode('utf-8'))
+    digest.update(_tree_manifest(logo_dir).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _pdf_is_up_to_date(output_dir, build_hash):
+    """Return True if the PDF in output_dir exists and was last built from build_hash."""
+    if not os.path.isfile(os.path.join(output_dir, 'presentation.pdf')):
+        return False
+    try:
+        with open(os.path.join(output_dir, BUILD_HASH_FILE), 'r', encoding='utf-8') as f:
+            return f.read() == build_hash
+    except FileNotFoundError:
+        return False
+
+
+def compile_latex(output_dir, tex_file='presentation.tex'):
+    """
+    Compile tex_file in output_dir by invoking the LaTeX compiler directly.
+
+    Tectonic is preferred since it runs as many passes as the document needs;
+    otherwise pdflatex is run twice so the table of contents resolves.
+
+    Parameters:
+    -----------
+    output_dir : str or Path
+        Directory containing tex_file; the PDF is written next to it
+    tex_file : str
+        Name of the LaTeX file to compile
+
+    Returns:
+    --------
+    bool
+        True if this run produced the PDF; a PDF left by an earlier build
+        is removed first so it is never mistaken for a fresh one
+
+    Raises:
+    -------
+    FileNotFoundError
+        If neither tectonic nor pdflatex is on PATH
+    """
+    pdf_path = os.path.join(output_dir, os.path.splitext(tex_file)[0] + '.pdf')
+
+    tectonic = _find_tool('tectonic', output_dir)
+    pdflatex = None if tectonic else _find_tool('pdflatex', output_dir)
+    if tectonic is None and pdflatex is None:
+        raise FileNotFoundError("neither tectonic nor pdflatex is on PATH")
+
+    # Remove a PDF left by an earlier build so success means this run produced it
+    try:
+        os.remove(pdf_path)
+    except FileNotFoundError:
+        pass
+
+    if tectonic:
+        print("\nCompiling with Tectonic...")
+        result = _run([tectonic, tex_file, '--keep-intermediates', '--synctex'], cwd=output_dir)
+        return result.returncode == 0 and os.path.isfile(pdf_path)
+
+    # Check for the PDF rather than the exit code, as warnings can cause a non-zero exit
+    for compile_pass in ('first', 'second'):
+        print(f"\nRunning {compile_pass} pdflatex pass...")
+        _run([pdflatex, '-interaction=nonstopmode', tex_file], cwd=output_dir)
+        if not os.path.isfile(pdf_path):
+            return False
+
+    return True
+
+
 def main():
     """Main execution function."""
 
@@ -873,7 +1454,7 @@ def main():
         sys.exit(1)
 
     # Verify notebook exists
-    if not os.path.exists(notebook_path):
+    if not os.path.isfile(notebook_path):
         print(f"Error: Notebook '{notebook_path}' not found.")
         sys.exit(1)
 
@@ -890,35 +1471,30 @@ def main():
 
     # Create presentation directory with new structure
     output_dir = script_dir / 'output'
-    os.makedirs(output_dir, exist_ok=True)
-    os.makedirs(output_dir / 'assets' / 'figures', exist_ok=True)
-    os.makedirs(output_dir / 'assets' / 'code', exist_ok=True)
-
-    # Extract markdown cells
-    print("Step 1: Extracting markdown cells from Jupyter notebook...")
-    markdown_cells = extract_markdown_cells(notebook_path)
-    print(f"✓ Extracted {len(markdown_cells)} markdown cells\n")
-
-    # Extract code cells
-    print("Step 2: Extracting code cells from Jupyter notebook...")
-    code_cells = extract_code_cells(notebook_path)
-    print(f"✓ Extracted {len(code_cells)} code cells\n")
+    assets_dir = output_dir / 'assets'
+    for directory in (assets_dir / 'figures', assets_dir / 'code', assets_dir / 'logos'):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    # Extract markdown cells, code cells and images in a single pass over the notebook
+    print("Step 1: Extracting markdown cells, code cells and images from Jupyter notebook...")
+    cell_cache_path = output_dir / CELL_CACHE_FILE
+    cell_cache = _load_json_cache(cell_cache_path)
+    markdown_cells, code_cells, images = extract_all(notebook_path, str(output_dir / 'assets' / 'figures'), cell_cache)
+    print(f"✓ Extracted {len(markdown_cells)} markdown cells")
+    print(f"✓ Extracted {len(code_cells)} code cells")
+    print(f"✓ Extracted {len(images)} images\n")
 
     # Save code cells to external files
-    print("Step 3: Saving code cells to external files...")
-    saved_code_files = save_code_cells_to_files(code_cells, str(output_dir / 'assets' / 'code'))
+    print("Step 2: Saving code cells to external files...")
+    saved_code_files = save_code_cells_to_files(code_cells, str(output_dir / 'assets' / 'code'), cell_cache)
+    _save_json_cache(cell_cache_path, cell_cache)
     print(f"✓ Saved {len(saved_code_files)} code files\n")
 
-    # Extract images from notebook
-    print("Step 4: Extracting images from Jupyter notebook...")
-    images = extract_images_from_notebook(notebook_path, str(output_dir / 'assets' / 'figures'))
-    print(f"✓ Extracted {len(images)} images\n")
-
     if not images:
         print("Warning: No images found in notebook. Generating presentation without images...")
 
     # Generate LaTeX content with images, markdown, and code
-    print("Step 5: Generating LaTeX Beamer presentation...")
+    print("Step 3: Generating LaTeX Beamer presentation...")
     latex_content = generate_beamer_with_content(images, markdown_cells, code_cells, theme, script_dir)
 
     # Save presentation
@@ -926,14 +1502,14 @@ def main():
     print()
 
     # Create compile script
-    print("Step 6: Creating compilation script...")
+    print("Step 4: Creating compilation script...")
     create_compile_script(str(output_dir), script_dir)
 
     # Copy logo assets to output directory
     logo_src = script_dir / 'assets' / 'logos'
     logo_dst = output_dir / 'assets' / 'logos'
     if logo_src.exists():
-        shutil.copytree(logo_src, logo_dst, dirs_exist_ok=True)
+        _sync_tree(logo_src, logo_dst)
     print()
 
     # Summary
@@ -957,33 +1533,31 @@ def main():
 
     # Automatically compile the presentation
     print("\n" + "="*80)
-    print("Step 7: Compiling presentation...")
+    print("Step 5: Compiling presentation...")
     print("="*80)
 
-    import subprocess
-    import platform
+    # Skip compilation when nothing the PDF is built from has changed
+    build_hash = _build_hash(latex_content, cell_cache, logo_dst)
+    pdf_up_to_date = _pdf_is_up_to_date(output_dir, build_hash)
 
-    # Detect OS and run appropriate compile script
-    current_os = platform.system()
-    compile_success = False
+    # Forget the last build's hash until this run's compile succeeds, so a
+    # failed or interrupted compile can never be recorded as up to date
+    if not pdf_up_to_date:
+        try:
+            os.remove(output_dir / BUILD_HASH_FILE)
+        except FileNotFoundError:
+            pass
 
     # Check if Tectonic is available (for Windows primarily)
-    if current_os == 'Windows':
+    if _IS_WINDOWS and not pdf_up_to_date:
         print("\nChecking for LaTeX compiler...")
-        tectonic_check = subprocess.run(['where', 'tectonic'],
-                                       capture_output=True,
-                                       text=True)
-
-        if tectonic_check.returncode != 0:
+        if _find_tool('tectonic', str(output_dir)) is None:
             print("Tectonic not found. Checking for Scoop package manager...")
-            scoop_check = subprocess.run(['where', 'scoop'],
-                                        capture_output=True,
-                                        text=True)
+            scoop = _find_tool('scoop', str(output_dir))
 
-            if scoop_check.returncode == 0:
+            if scoop:
                 print("Found Scoop! Installing Tectonic automatically...")
-                install_result = subprocess.run(['scoop', 'install', 'tectonic'],
-                                              capture_output=False)
+                install_result = _run([scoop, 'install', 'tectonic'])
                 if install_result.returncode == 0:
                     print("✓ Tectonic installed successfully!")
                 else:
@@ -1004,29 +1578,16 @@ def main():
                 print("\nAfter installation, run the presentation generator again.")
                 return
 
+    compile_success = False
     try:
-        if current_os == 'Windows':
-            # Windows - use Tectonic via batch script
-            print("\nCompiling with Tectonic...")
-            result = subprocess.run(
-                ['compile_presentation.bat', 'presentation.tex'],
-                cwd=str(output_dir),
-                capture_output=False,
-                text=True
-            )
-            compile_success = result.returncode == 0
-        else:
-            # macOS, Linux, or other Unix-like systems
-            print(f"\nDetected {current_os} - compiling with pdflatex...")
-            result = subprocess.run(
-                ['./compile_presentation.sh', 'presentation.tex'],
-                cwd=str(output_dir),
-                capture_output=False,
-                text=True
-            )
-            compile_success = result.returncode == 0
-
-        if compile_success:
+        if pdf_up_to_date:
+            print("\n✓ PDF up to date, skipping compilation: output/presentation.pdf")
+        elif compile_latex(str(output_dir)):
+            # compile_latex only succeeds when this run produced the PDF
+            compile_success = True
+            with open(output_dir / BUILD_HASH_FILE, 'w', encoding='utf-8') as f:
+                f.write(build_hash)
+
             print("\n" + "="*80)
             print("✓ PDF compilation successful!")
             print("="*80)
@@ -1037,7 +1598,7 @@ def main():
             print("="*80)
             print("\nPlease check the output above for errors.")
             print("\nYou can manually re-compile using:")
-            if current_os == 'Windows':
+            if _IS_WINDOWS:
                 print("   cd output")
                 print("   compile_presentation.bat presentation.tex")
             else:
@@ -1045,7 +1606,7 @@ def main():
                 print("   ./compile_presentation.sh presentation.tex")
     except FileNotFoundError as e:
         print(f"\n⚠ Compilation tool not found: {e}")
-        if current_os == 'Windows':
+        if _IS_WINDOWS:
             print("\nFor Windows, please install Tectonic:")
             print("   Run: install_tectonic.bat")
             print("   Or: scoop install tectonic")
@@ -1056,11 +1617,14 @@ def main():
     except Exception as e:
         print(f"\n⚠ Compilation error: {e}")
         print("\nYou can manually compile using:")
-        if current_os == 'Windows':
+        if _IS_WINDOWS:
             print("   cd output && compile_presentation.bat presentation.tex")
         else:
             print("   cd output && ./compile_presentation.sh presentation.tex")
 
+    if compile_success:
+        _open_pdf(str(output_dir / 'presentation.pdf'))
+
     print("\n" + "="*80)
     print("All images, markdown content, and code cells have been automatically extracted!")
     print("Code files are available in output/assets/code/ directory for inclusion via \\CODE{} macro.")